@@ -1,7 +1,14 @@
 import json
+from datetime import date, timedelta
 
 from apps.users.enums import USER_ROLE
-from utils.factories import CountryFactory, ContactFactory, OrganizationFactory, CommunicationMediumFactory
+from utils.factories import (
+    CountryFactory,
+    ContactFactory,
+    OrganizationFactory,
+    CommunicationFactory,
+    CommunicationMediumFactory,
+)
 from utils.permissions import PERMISSION_DENIED_MESSAGE
 from utils.tests import HelixGraphQLTestCase, create_user_with_role
 
@@ -201,3 +208,13 @@ class TestCommunication(HelixGraphQLTestCase):
         content = response.json()
         self.assertResponseNoErrors(response)
         self.assertTrue(content['data']['createCommunication']['ok'], content)
+
+    def test_communication_factory(self):
+        communications = CommunicationFactory.create_batch(2, contact=self.contact)
+        for communication in communications:
+            communication.refresh_from_db()
+            self.assertEqual(communication.contact, self.contact)
+            self.assertIsNotNone(communication.medium_id)
+            self.assertIsInstance(communication.date, date)
+        # The date counts back one day for each communication
+        self.assertEqual(communications[0].date - communications[1].date, timedelta(days=1))
@@ -54,7 +54,7 @@ class ExcelExportType(DjangoObjectType):
     def resolve_file(root, info, **kwargs):
         if not getattr(root, 'file', None):
             return None
-        return info.context.request.build_absolute_uri(root.file.url)
+        return info.context.load_absolute_file_url(root.file)
 
 
 class ExcelExportsListType(CustomDjangoListObjectType):
@@ -162,7 +162,7 @@ class AttachmentType(DjangoObjectType):
     attachment_for_display = EnumDescription(source='get_attachment_for_display')
 
     def resolve_attachment(root, info, **kwargs):
-        return info.context.request.build_absolute_uri(root.attachment.url)
+        return info.context.load_absolute_file_url(root.attachment)
 
 
 class BulkApiOperationFilterType(graphene.ObjectType):
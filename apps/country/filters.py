@@ -209,14 +209,13 @@ class CountryFilter(django_filters.FilterSet):
         # Aggregate filter logic
         aggregate_figures = self.data.get('aggregate_figures') or {}
         year = aggregate_figures.get('year')
-        report_id = FigureFilterHelper.get_report_id_from_filter_data(aggregate_figures)
-        report = report_id and FigureFilterHelper.get_report(report_id)
+        # NOTE: This also raises ValidationError if the provided report doesn't exist
+        figure_qs, end_date = FigureFilterHelper.aggregate_data_generate(aggregate_figures, self.request)
         # Only 1 is allowed among report and year
-        if report and year:
+        if year and FigureFilterHelper.get_report_id_from_filter_data(aggregate_figures):
             raise ValidationError(gettext('Cannot pass both report and year in filter'))
 
         start_date = None
-        figure_qs, end_date = FigureFilterHelper.aggregate_data_generate(aggregate_figures, self.request)
         if end_date is None:
             year = year or timezone.now().year
             start_date = datetime.datetime(year=int(year), month=1, day=1)
@@ -1,7 +1,11 @@
 import json
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.contact.models import Contact
 from apps.users.enums import USER_ROLE
-from utils.factories import CountryFactory, ContactFactory
+from utils.factories import CountryFactory, CountryRegionFactory, ContactFactory
 from utils.tests import HelixGraphQLTestCase, create_user_with_role
 
 
@@ -44,3 +48,140 @@ class TestCountrySchema(HelixGraphQLTestCase):
         self.assertEqual(set(contact_ids), {self.contact1.id})
         contact_ids = [int(each['id']) for each in content['data']['country']['operatingContacts']['results']]
         self.assertEqual(set(contact_ids), {self.contact2.id})
+
+
+class TestCountryContactLists(HelixGraphQLTestCase):
+    """
+    contacts is a foreign key and operatingContacts a many to many relation. Nested in countryList, both are resolved
+    by the PaginatedListLoader (page and count for all the countries in one batch).
+    """
+    def setUp(self) -> None:
+        region = CountryRegionFactory.create()
+        self.country_a, self.country_b, self.country_c = CountryFactory.create_batch(3, region=region)
+        self.alice = ContactFactory.create(first_name='Alice', country=self.country_a)
+        self.bob = ContactFactory.create(first_name='Bob', country=self.country_a)
+        self.alina = ContactFactory.create(first_name='Alina', country=self.country_a)
+        self.carl = ContactFactory.create(first_name='Carl', country=self.country_b)
+        for contact in (self.alice, self.bob, self.alina):
+            contact.countries_of_operation.set([self.country_b])
+        self.carl.countries_of_operation.set([self.country_a, self.country_b])
+        # NOTE: country_c doesn't have any contact
+        self.list_query = '''
+        query CountryContacts(
+          $regions: [String!],
+          $page: Int = 1,
+          $pageSize: Int = 20,
+          $filters: ContactFilterDataInputType = {}
+        ) {
+          countryList(ordering: "id", filters: {regionByIds: $regions}) {
+            results {
+              id
+              contacts(ordering: "id", page: $page, pageSize: $pageSize, filters: $filters) {
+                totalCount
+                results { id }
+              }
+              operatingContacts(ordering: "id", page: $page, pageSize: $pageSize, filters: $filters) {
+                totalCount
+                results { id }
+              }
+            }
+          }
+        }
+        '''
+        self.list_variables = {'regions': [str(region.id)]}
+        self.force_login(create_user_with_role(USER_ROLE.ADMIN.name))
+
+    def _query_country_list(self, **variables):
+        response = self.query(self.list_query, variables={**self.list_variables, **variables})
+        self.assertResponseNoErrors(response)
+        return {
+            int(country['id']): country
+            for country in response.json()['data']['countryList']['results']
+        }
+
+    @staticmethod
+    def _get_ids(paginated_list):
+        return [int(each['id']) for each in paginated_list['results']]
+
+    def test_fk_and_m2m_lists_for_multiple_countries(self):
+        countries = self._query_country_list()
+        self.assertEqual(set(countries), {self.country_a.id, self.country_b.id, self.country_c.id})
+
+        self.assertEqual(countries[self.country_a.id]['contacts']['totalCount'], 3)
+        self.assertEqual(
+            self._get_ids(countries[self.country_a.id]['contacts']),
+            [self.alice.id, self.bob.id, self.alina.id],
+        )
+        self.assertEqual(countries[self.country_a.id]['operatingContacts']['totalCount'], 1)
+        self.assertEqual(self._get_ids(countries[self.country_a.id]['operatingContacts']), [self.carl.id])
+
+        self.assertEqual(countries[self.country_b.id]['contacts']['totalCount'], 1)
+        self.assertEqual(self._get_ids(countries[self.country_b.id]['contacts']), [self.carl.id])
+        self.assertEqual(countries[self.country_b.id]['operatingContacts']['totalCount'], 4)
+        self.assertEqual(
+            self._get_ids(countries[self.country_b.id]['operatingContacts']),
+            [self.alice.id, self.bob.id, self.alina.id, self.carl.id],
+        )
+
+    def test_countries_without_contacts_have_zero_count(self):
+        countries = self._query_country_list()
+        for field in ('contacts', 'operatingContacts'):
+            self.assertEqual(countries[self.country_c.id][field]['totalCount'], 0)
+            self.assertEqual(countries[self.country_c.id][field]['results'], [])
+
+    def test_count_is_the_total_for_each_page(self):
+        countries = self._query_country_list(page=2, pageSize=2)
+        self.assertEqual(countries[self.country_a.id]['contacts']['totalCount'], 3)
+        self.assertEqual(self._get_ids(countries[self.country_a.id]['contacts']), [self.alina.id])
+        self.assertEqual(countries[self.country_b.id]['operatingContacts']['totalCount'], 4)
+        self.assertEqual(
+            self._get_ids(countries[self.country_b.id]['operatingContacts']),
+            [self.alina.id, self.carl.id],
+        )
+
+    def test_filtered_count_matches_filtered_page(self):
+        countries = self._query_country_list(filters={'firstNameContains': 'Ali'})
+        self.assertEqual(countries[self.country_a.id]['contacts']['totalCount'], 2)
+        self.assertEqual(
+            self._get_ids(countries[self.country_a.id]['contacts']),
+            [self.alice.id, self.alina.id],
+        )
+        self.assertEqual(countries[self.country_a.id]['operatingContacts']['totalCount'], 0)
+        self.assertEqual(countries[self.country_b.id]['contacts']['totalCount'], 0)
+        self.assertEqual(countries[self.country_b.id]['operatingContacts']['totalCount'], 2)
+        self.assertEqual(
+            self._get_ids(countries[self.country_b.id]['operatingContacts']),
+            [self.alice.id, self.alina.id],
+        )
+
+    def _query_country_contacts(self, page_size):
+        query = '''
+        query CountryContacts($id: ID!, $pageSize: Int) {
+          country(id: $id) {
+            contacts(ordering: "id", pageSize: $pageSize) {
+              totalCount
+              results { id }
+            }
+          }
+        }
+        '''
+        with CaptureQueriesContext(connection) as queries:
+            response = self.query(query, variables={'id': str(self.country_a.id), 'pageSize': page_size})
+        self.assertResponseNoErrors(response)
+        count_queries = [
+            each['sql'] for each in queries.captured_queries
+            if 'COUNT(' in each['sql'] and Contact._meta.db_table in each['sql']
+        ]
+        return response.json()['data']['country']['contacts'], count_queries
+
+    def test_count_query_is_skipped_when_the_first_page_is_not_full(self):
+        contacts, count_queries = self._query_country_contacts(page_size=10)
+        self.assertEqual(contacts['totalCount'], 3)
+        self.assertEqual(self._get_ids(contacts), [self.alice.id, self.bob.id, self.alina.id])
+        self.assertEqual(count_queries, [])
+
+        # A full first page still needs the count
+        contacts, count_queries = self._query_country_contacts(page_size=2)
+        self.assertEqual(contacts['totalCount'], 3)
+        self.assertEqual(self._get_ids(contacts), [self.alice.id, self.bob.id])
+        self.assertEqual(len(count_queries), 1)
@@ -44,10 +44,10 @@ from utils.graphene.fields import DjangoPaginatedListObjectField
 from utils.graphene.pagination import PageGraphqlPaginationWithoutCount
 from apps.extraction.filters import (
     FigureExtractionFilterSet,
-    ReportFigureExtractionFilterSet,
     FigureExtractionFilterDataInputType,
     EntryExtractionFilterSet,
 )
+from utils.figure_filter import FigureFilterHelper
 from apps.crisis.enums import CrisisTypeGrapheneEnum
 from apps.crisis.models import Crisis
 from apps.event.schema import OtherSubTypeObjectType, EventType
@@ -521,7 +521,7 @@ class SourcePreviewType(DjangoObjectType):
 
     def resolve_pdf(root, info, **kwargs):
         if root.status == SourcePreview.PREVIEW_STATUS.COMPLETED:
-            return info.context.request.build_absolute_uri(root.pdf.url)
+            return info.context.load_absolute_file_url(root.pdf)
         return None
 
 
@@ -648,7 +648,7 @@ class Query:
                 figure_cause=figure_cause,
             ).values('canonical_date').annotate(value=Sum('total_figures'))
 
-        figure_qs = ReportFigureExtractionFilterSet(data=filters).qs
+        figure_qs = FigureFilterHelper.get_figure_qs(filters, info.context.request)
 
         idps_conflict_figure_qs = figure_qs.filter(
             category=Figure.FIGURE_CATEGORY_TYPES.IDPS,
@@ -0,0 +1,20 @@
+from utils.tests import HelixTestCase
+from utils.common import to_hashable
+
+
+class TestToHashable(HelixTestCase):
+    def test_should_ignore_dict_and_set_ordering(self):
+        self.assertEqual(
+            to_hashable({'countries': {1, 2}, 'roles': ['A', 'B']}),
+            to_hashable({'roles': ['A', 'B'], 'countries': {2, 1}}),
+        )
+
+    def test_should_keep_the_container_type(self):
+        self.assertNotEqual(to_hashable([1, 2]), to_hashable((1, 2)))
+        self.assertNotEqual(to_hashable([1, 2]), to_hashable({1, 2}))
+        self.assertNotEqual(to_hashable({'a': 1}), to_hashable([('a', 1)]))
+        self.assertNotEqual(to_hashable(['A', 'B']), to_hashable(['B', 'A']))
+
+    def test_should_raise_type_error_for_unorderable_keys(self):
+        with self.assertRaises(TypeError):
+            to_hashable({1: 'a', 'b': 'c'})
@@ -168,12 +168,12 @@ class ReportGenerationType(DjangoObjectType):
 
     def resolve_full_report(root, info, **kwargs):
         if root.status == ReportGeneration.REPORT_GENERATION_STATUS.COMPLETED:
-            return info.context.request.build_absolute_uri(root.full_report.url)
+            return info.context.load_absolute_file_url(root.full_report)
         return None
 
     def resolve_snapshot(root, info, **kwargs):
         if root.status == ReportGeneration.REPORT_GENERATION_STATUS.COMPLETED:
-            return info.context.request.build_absolute_uri(root.snapshot.url)
+            return info.context.load_absolute_file_url(root.snapshot)
         return None
 
 
@@ -1,3 +1,4 @@
+from django.core.files.base import ContentFile
 from django.utils import timezone
 from apps.users.enums import USER_ROLE
 from apps.report.models import ReportGeneration, Report
@@ -239,6 +240,32 @@ class TestReportSignOff(HelixGraphQLTestCase):
         self.assertEqual(content['data']['signOffReport']['result']['id'], str(self.report.id))
         self.assertEqual(len(content['data']['signOffReport']['result']['generations']['results']), 1)
 
+    def test_report_generation_empty_file_resolves_to_null(self):
+        generation = ReportGeneration.objects.create(
+            report=self.report,
+            status=ReportGeneration.REPORT_GENERATION_STATUS.COMPLETED,
+        )
+        generation.snapshot.save('snapshot.png', ContentFile(b'snapshot'))
+        query = '''
+        query Generation($id: ID!) {
+          generation(id: $id) {
+            snapshot
+            fullReport
+          }
+        }
+        '''
+        self.force_login(self.admin)
+        response = self.query(query, variables={'id': str(generation.id)})
+        content = response.json()
+
+        self.assertResponseNoErrors(response)
+        # An empty file shouldn't resolve to the request (graphql endpoint) url
+        self.assertIsNone(content['data']['generation']['fullReport'], content)
+        self.assertTrue(
+            content['data']['generation']['snapshot'].endswith(generation.snapshot.url),
+            content,
+        )
+
     def test_invalid_report_signoff(self):
         editor = create_user_with_role(USER_ROLE.MONITORING_EXPERT.name)
         self.force_login(editor)
@@ -8,12 +8,26 @@ class Command(BaseCommand):
     help = 'Initialize or update roles.'
 
     def handle(self, *args, **options):
+        codenames = {
+            f'{action.name}_{model.name}'
+            for role in USER_ROLES
+            for action, models in PERMISSIONS[role].items()
+            for model in models
+        }
+        # NOTE: All the permissions are fetched at once, instead of a query for each permission of each role
+        permission_by_codename = {
+            permission.codename: permission
+            for permission in Permission.objects.filter(codename__in=codenames)
+        }
+        missing_codenames = codenames - permission_by_codename.keys()
+        if missing_codenames:
+            raise Permission.DoesNotExist(f'Permissions not found: {", ".join(sorted(missing_codenames))}')
         for role in USER_ROLES:
             group, created = Group.objects.get_or_create(name=role.name)
             permissions = list()
             for action, models in PERMISSIONS[role].items():
                 permissions.extend([
-                    Permission.objects.get(codename=f'{action.name}_{model.name}') for model in models
+                    permission_by_codename[f'{action.name}_{model.name}'] for model in models
                 ])
             group.permissions.set(permissions)
             self.stdout.write(self.style.SUCCESS(f'{"Created" if created else "Updated"} '
@@ -16,6 +16,9 @@ if [ "$CI" == "true" ]; then
     coverage html -i
     coverage xml
     set +e
+elif [ -n "$PYTEST_WORKERS" ]; then
+    # Run the test classes in parallel, each xdist worker gets its own test database (test_<db>_gw<N>)
+    py.test -n "$PYTEST_WORKERS" --dist=loadscope --reuse-db
 else
     py.test
 fi
@@ -71,6 +71,22 @@ def convert_date_object_to_string_in_dict(dictionary):
     return dictionary
 
 
+def to_hashable(value):
+    """
+    Convert (nested) dicts, lists, tuples and sets, e.g. filter data, into tuples so that they can be used as cache
+    keys. The container type is part of the key, so a list and a tuple with the same items don't share a key.
+
+    Raises TypeError if a value can't be converted (unorderable dict keys).
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, to_hashable(_value)) for key, _value in value.items())))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(to_hashable(_value) for _value in value))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(to_hashable(_value) for _value in value))
+    return value
+
+
 def add_clone_prefix(sentence):
     """
 
@@ -1,14 +1,127 @@
 import factory
-from datetime import date
+import factory.random
+import itertools
+from datetime import date, timedelta
 from dateutil.utils import today
 from factory.django import DjangoModelFactory
 
-from apps.contact.models import Contact
+from apps.contact.models import Communication, CommunicationMedium, Contact
+from apps.contrib.models import Client, ClientTrackInfo
+from apps.country.models import (
+    ContextualAnalysis,
+    Country,
+    CountryRegion,
+    CountrySubRegion,
+    GeographicalGroup,
+    HouseholdSize,
+    MonitoringSubRegion,
+    Summary,
+)
 from apps.crisis.models import Crisis
-from apps.entry.models import Figure, OSMName
-from apps.event.models import Event, EventCode
+from apps.entry.models import Entry, Figure, FigureTag, OSMName
+from apps.event.models import (
+    Actor,
+    ContextOfViolence,
+    DisasterCategory,
+    DisasterSubCategory,
+    DisasterSubType,
+    DisasterType,
+    Event,
+    EventCode,
+    OtherSubType,
+    Violence,
+    ViolenceSubType,
+)
+from apps.extraction.models import ExtractionQuery
+from apps.notification.models import Notification
+from apps.organization.models import Organization, OrganizationKind
+from apps.parking_lot.models import ParkedItem
+from apps.report.models import Report, ReportComment
+from apps.resource.models import Resource, ResourceGroup
+from apps.review.models import UnifiedReviewComment
+from apps.users.models import User
 from apps.common.enums import GENDER_TYPE
 
+# Seed the random generator shared by factory.Faker and the fuzzy attributes, keeps generated values reproducible
+factory.random.reseed_random(0)
+
+# Small pool of paragraphs generated once and cycled through, tests never inspect these values
+_PARAGRAPHS = tuple(factory.Faker('paragraph').generate() for _ in range(32))
+_paragraph_counter = itertools.count()
+_TODAY = today().date()
+
+
+def _paragraph():
+    return _PARAGRAPHS[next(_paragraph_counter) % len(_PARAGRAPHS)]
+
+
+def _seq_email(n):
+    return f'admin{n}@email.com'
+
+
+def _seq_username(n):
+    return f'username{n}'
+
+
+def _seq_short_name(n):
+    return f'shortname {n}'
+
+
+def _seq_medium_name(n):
+    return f'Medium{n}'
+
+
+def _seq_event_code(n):
+    return f'Code-{n}'
+
+
+def _seq_article_title(n):
+    return f'long title {n}'
+
+
+def _seq_reported(n):
+    return n + 2
+
+
+def _seq_resource_name(n):
+    return f'resource{n}'
+
+
+def _seq_display_name(n):
+    return f'osm-name-{n}'
+
+
+def _seq_lat(n):
+    return 100 + (n * 7 % 101)
+
+
+def _seq_lon(n):
+    return 100 + (n * 13 % 101)
+
+
+def _seq_geographical_group_name(n):
+    return f'geographical-group-{n}'
+
+
+def _seq_country_sub_region_name(n):
+    return f'country-sub-region-{n}'
+
+
+def _seq_monitoring_sub_region_name(n):
+    return f'monitoring-sub-region-{n}'
+
+
+def _seq_region_name(n):
+    return f'region-{n}'
+
+
+def _seq_country_name(n):
+    return f'country-{n}'
+
+
+def _seq_communication_date(n):
+    return _TODAY - timedelta(days=n)
+
 
 class UserFactory(DjangoModelFactory):
     """
@@ -20,17 +133,17 @@ class UserFactory(DjangoModelFactory):
     Attributes:
         model (str): The name of the model to be used for creating User objects.
 
-        email (str): The email address of the User. It is generated using a lambda function that appends a sequence
+        email (str): The email address of the User. It is generated using a sequence function that appends a sequence
         number to the base email 'admin'.
 
-        username (str): The username of the User. It is generated using a lambda function that appends a sequence number
+        username (str): The username of the User. It is generated using a sequence function that appends a sequence number
         to the base username 'username'.
     """
     class Meta:
-        model = 'users.User'
+        model = User
 
-    email = factory.Sequence(lambda n: f'admin{n}@email.com')
-    username = factory.Sequence(lambda n: f'username{n}')
+    email = factory.Sequence(_seq_email)
+    username = factory.Sequence(_seq_username)
 
 
 class GeographicalGroupFactory(DjangoModelFactory):
@@ -41,13 +154,13 @@ class GeographicalGroupFactory(DjangoModelFactory):
     This class is a factory for creating instances of the GeographicalGroup model in the 'country' app.
 
     Attributes:
-    - name: This attribute represents the name of the geographical group and is generated using the Faker library.
+    - name: This attribute represents the name of the geographical group and is generated using a sequence.
 
     """
     class Meta:
-        model = 'country.GeographicalGroup'
+        model = GeographicalGroup
 
-    name = factory.Faker('first_name')
+    name = factory.Sequence(_seq_geographical_group_name)
 
 
 class CountrySubRegionFactory(DjangoModelFactory):
@@ -55,17 +168,17 @@ class CountrySubRegionFactory(DjangoModelFactory):
     Factory class for creating instances of the model 'country.CountrySubRegion'.
     """
     class Meta:
-        model = 'country.CountrySubRegion'
+        model = CountrySubRegion
 
-    name = factory.Faker('first_name')
+    name = factory.Sequence(_seq_country_sub_region_name)
 
 
 class MonitoringSubRegionFactory(DjangoModelFactory):
     """"""
     class Meta:
-        model = 'country.MonitoringSubRegion'
+        model = MonitoringSubRegion
 
-    name = factory.Faker('first_name')
+    name = factory.Sequence(_seq_monitoring_sub_region_name)
 
 
 class CountryRegionFactory(DjangoModelFactory):
@@ -76,13 +189,13 @@ class CountryRegionFactory(DjangoModelFactory):
     This class is a factory for creating instances of the CountryRegion model in the Django application.
 
     Attributes:
-        name: A factory attribute that generates a fake first name for the name field of the CountryRegion model.
+        name: A factory attribute that generates a sequential name for the name field of the CountryRegion model.
 
     """
     class Meta:
-        model = 'country.CountryRegion'
+        model = CountryRegion
 
-    name = factory.Faker('first_name')
+    name = factory.Sequence(_seq_region_name)
 
 
 class CountryFactory(DjangoModelFactory):
@@ -103,9 +216,9 @@ class CountryFactory(DjangoModelFactory):
         monitoring_sub_region = country.monitoring_sub_region
     """
     class Meta:
-        model = 'country.Country'
+        model = Country
 
-    name = factory.Faker('first_name')
+    name = factory.Sequence(_seq_country_name)
     region = factory.SubFactory(CountryRegionFactory)
     monitoring_sub_region = factory.SubFactory(MonitoringSubRegionFactory)
 
@@ -115,16 +228,16 @@ class ContextualAnalysisFactory(DjangoModelFactory):
     Factory class for creating instances of ContextualAnalysis model.
 
     Attributes:
-        update (str): A randomly generated paragraph for the update field.
+        update (str): A paragraph picked from a pre-generated pool for the update field.
         country (Country): A subfactory to create a related Country object.
 
     Meta:
         model (str): The name of the model that this factory creates instances of.
     """
     class Meta:
-        model = 'country.ContextualAnalysis'
+        model = ContextualAnalysis
 
-    update = factory.Faker('paragraph')
+    update = factory.LazyFunction(_paragraph)
     country = factory.SubFactory(CountryFactory)
 
 
@@ -136,7 +249,7 @@ class SummaryFactory(DjangoModelFactory):
     class.
 
     Attributes:
-        summary (str): A string representing a summary. It is generated using the factory.Faker('paragraph') method.
+        summary (str): A string representing a summary. It is picked from a pre-generated pool of paragraphs.
         country (CountryFactory): An instance of the CountryFactory class, used as a foreign key for the created Summary
         instance.
 
@@ -148,9 +261,9 @@ class SummaryFactory(DjangoModelFactory):
         This class requires the DjangoModelFactory and CountryFactory classes to be imported in order to use it.
     """
     class Meta:
-        model = 'country.Summary'
+        model = Summary
 
-    summary = factory.Faker('paragraph')
+    summary = factory.LazyFunction(_paragraph)
     country = factory.SubFactory(CountryFactory)
 
 
@@ -174,7 +287,7 @@ class OrganizationKindFactory(DjangoModelFactory):
         This factory class requires the DjangoModelFactory class from the factory_boy library to be installed.
     """
     class Meta:
-        model = 'organization.OrganizationKind'
+        model = OrganizationKind
 
     name = factory.Faker('company_suffix')
 
@@ -187,9 +300,9 @@ class OrganizationFactory(DjangoModelFactory):
         short_name (str): The short name of the organization.
     """
     class Meta:
-        model = 'organization.Organization'
+        model = Organization
 
-    short_name = factory.Sequence(lambda n: 'shortname %d' % n)
+    short_name = factory.Sequence(_seq_short_name)
 
 
 class ContactFactory(DjangoModelFactory):
@@ -213,7 +326,7 @@ class ContactFactory(DjangoModelFactory):
     Note: This class extends DjangoModelFactory and has Meta class to define the model it is associated with.
     """
     class Meta:
-        model = 'contact.Contact'
+        model = Contact
 
     designation = factory.Iterator(Contact.DESIGNATION)
     first_name = factory.Faker('first_name')
@@ -237,9 +350,9 @@ class CommunicationMediumFactory(DjangoModelFactory):
         medium = medium_factory.create()
     """
     class Meta:
-        model = 'contact.CommunicationMedium'
+        model = CommunicationMedium
 
-    name = factory.Sequence(lambda n: f'Medium{n}')
+    name = factory.Sequence(_seq_medium_name)
 
 
 class CommunicationFactory(DjangoModelFactory):
@@ -249,21 +362,19 @@ class CommunicationFactory(DjangoModelFactory):
 
     Attributes:
         contact (ContactFactory): A factory for generating instances of the Contact model.
-        title (str): The title of the communication.
         subject (str): The subject of the communication.
         content (str): The content of the communication.
-        date_time (datetime): The date and time of the communication.
+        date (date): The date of the communication, counting back one day per instance from today.
         medium (CommunicationMediumFactory): A factory for generating instances of the CommunicationMedium model.
 
     """
     class Meta:
-        model = 'contact.Communication'
+        model = Communication
 
     contact = factory.SubFactory(ContactFactory)
-    title = factory.Faker('sentence')
     subject = factory.Faker('sentence')
-    content = factory.Faker('paragraph')
-    date_time = factory.Faker('date_time_this_month')
+    content = factory.LazyFunction(_paragraph)
+    date = factory.Sequence(_seq_communication_date)
     medium = factory.SubFactory(CommunicationMediumFactory)
 
 
@@ -292,7 +403,7 @@ class DisasterCategoryFactory(DjangoModelFactory):
         # The `category` variable now contains a newly created `DisasterCategory` instance
     """
     class Meta:
-        model = 'event.DisasterCategory'
+        model = DisasterCategory
 
 
 class DisasterSubCategoryFactory(DjangoModelFactory):
@@ -304,7 +415,7 @@ class DisasterSubCategoryFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'event.DisasterSubCategory'
+        model = DisasterSubCategory
 
     category = factory.SubFactory(DisasterCategoryFactory)
 
@@ -323,7 +434,7 @@ class DisasterTypeFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'event.DisasterType'
+        model = DisasterType
 
     disaster_sub_category = factory.SubFactory(DisasterSubCategoryFactory)
 
@@ -343,7 +454,7 @@ class DisasterSubTypeFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'event.DisasterSubType'
+        model = DisasterSubType
 
     type = factory.SubFactory(DisasterTypeFactory)
 
@@ -360,7 +471,7 @@ class ViolenceFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'event.Violence'
+        model = Violence
 
 
 class ViolenceSubTypeFactory(DjangoModelFactory):
@@ -391,7 +502,7 @@ class ViolenceSubTypeFactory(DjangoModelFactory):
     Note: This factory requires the DjangoModelFactory library to be installed.
     """
     class Meta:
-        model = 'event.ViolenceSubType'
+        model = ViolenceSubType
 
     violence = factory.SubFactory(ViolenceFactory)
 
@@ -405,7 +516,7 @@ class CrisisFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'crisis.Crisis'
+        model = Crisis
 
     crisis_type = factory.Iterator(Crisis.CRISIS_TYPE)
 
@@ -419,7 +530,7 @@ class ActorFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'event.Actor'
+        model = Actor
 
     country = factory.SubFactory(CountryFactory)
 
@@ -438,7 +549,7 @@ class ContextOfViolenceFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'event.ContextOfViolence'
+        model = ContextOfViolence
 
 
 class EventFactory(DjangoModelFactory):
@@ -451,8 +562,7 @@ class EventFactory(DjangoModelFactory):
         crisis (CrisisFactory): A subfactory used to create the crisis attribute of the Event instance.
         event_type (Iterator): An iterator used to assign a valid crisis type to the event_type attribute of the Event
         instance.
-        start_date (LazyFunction): A lazy function that returns a date object representing the start date of the event.
-        The default value is January 1, 2010.
+        start_date (date): The start date of the event. The default value is January 1, 2010.
         end_date (LazyFunction): A lazy function that returns a date object representing the end date of the event. The
         default value is today's date.
         violence (ViolenceFactory): A subfactory used to create the violence attribute of the Event instance.
@@ -493,7 +603,7 @@ class EventFactory(DjangoModelFactory):
 
     crisis = factory.SubFactory(CrisisFactory)
     event_type = factory.Iterator(Crisis.CRISIS_TYPE)
-    start_date = factory.LazyFunction(lambda: date(2010, 1, 1))
+    start_date = date(2010, 1, 1)
     end_date = factory.LazyFunction(today().date)
     violence = factory.SubFactory(ViolenceFactory)
     violence_sub_type = factory.SubFactory(ViolenceSubTypeFactory)
@@ -508,8 +618,7 @@ class EventFactory(DjangoModelFactory):
         if not create:
             return
         if extracted:
-            for country in extracted:
-                self.countries.add(country)
+            self.countries.add(*extracted)
 
 
 class EventCodeFactory(DjangoModelFactory):
@@ -517,12 +626,12 @@ class EventCodeFactory(DjangoModelFactory):
     Factory class for creating EventCode objects.
     """
     class Meta:
-        model = 'event.EventCode'
+        model = EventCode
 
     event = factory.SubFactory(EventFactory)
     country = factory.SubFactory(CountryFactory)
     event_code_type = factory.Iterator(EventCode.EVENT_CODE_TYPE)
-    event_code = factory.Sequence(lambda n: f'Code-{n}')
+    event_code = factory.Sequence(_seq_event_code)
 
 
 class EntryFactory(DjangoModelFactory):
@@ -536,16 +645,16 @@ class EntryFactory(DjangoModelFactory):
         DjangoModelFactory
 
     Attributes:
-        - article_title (str): The title of the article. A sequence is generated using a lambda function.
+        - article_title (str): The title of the article. A sequence is generated using a module level function.
         - url (str): The URL of the article.
         - publish_date (datetime): The date when the article was published. A lazy function is used to get the current
         date.
 
     """
     class Meta:
-        model = 'entry.Entry'
+        model = Entry
 
-    article_title = factory.Sequence(lambda n: f'long title {n}')
+    article_title = factory.Sequence(_seq_article_title)
     url = 'https://www.example.com'
     publish_date = factory.LazyFunction(today().date)
 
@@ -582,12 +691,12 @@ class FigureFactory(DjangoModelFactory):
     Note: This class extends the DjangoModelFactory class.
     """
     class Meta:
-        model = 'entry.Figure'
+        model = Figure
 
     entry = factory.SubFactory(EntryFactory)
     country = factory.SubFactory(CountryFactory)
     quantifier = factory.Iterator(Figure.QUANTIFIER)
-    reported = factory.Sequence(lambda n: n + 2)
+    reported = factory.Sequence(_seq_reported)
     unit = factory.Iterator(Figure.UNIT)
     household_size = 2  # validation based on unit in the serializer
     role = factory.Iterator(Figure.ROLE)
@@ -602,8 +711,7 @@ class FigureFactory(DjangoModelFactory):
         if not create:
             return
         if extracted:
-            for geo_location in extracted:
-                self.geo_locations.add(geo_location)
+            self.geo_locations.add(*extracted)
 
 
 class ResourceGroupFactory(DjangoModelFactory):
@@ -616,9 +724,9 @@ class ResourceGroupFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'resource.ResourceGroup'
+        model = ResourceGroup
 
-    name = factory.Sequence(lambda n: f'resource{n}')
+    name = factory.Sequence(_seq_resource_name)
 
 
 class ResourceFactory(DjangoModelFactory):
@@ -631,9 +739,9 @@ class ResourceFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'resource.Resource'
+        model = Resource
 
-    name = factory.Sequence(lambda n: f'resource{n}')
+    name = factory.Sequence(_seq_resource_name)
     group = factory.SubFactory(ResourceGroupFactory)
 
 
@@ -642,7 +750,7 @@ class UnifiedReviewCommentFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'review.UnifiedReviewComment'
+        model = UnifiedReviewComment
 
 
 class TagFactory(DjangoModelFactory):
@@ -651,7 +759,7 @@ class TagFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'entry.FigureTag'
+        model = FigureTag
 
 
 class ParkingLotFactory(DjangoModelFactory):
@@ -664,7 +772,7 @@ class ParkingLotFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'parking_lot.ParkedItem'
+        model = ParkedItem
 
     country = factory.SubFactory(CountryFactory)
 
@@ -676,7 +784,7 @@ class ReportFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'report.Report'
+        model = Report
 
 
 class ReportCommentFactory(DjangoModelFactory):
@@ -693,7 +801,7 @@ class ReportCommentFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'report.ReportComment'
+        model = ReportComment
 
     report = factory.SubFactory(ReportFactory)
 
@@ -714,7 +822,7 @@ class OtherSubtypeFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'event.otherSubType'
+        model = OtherSubType
 
 
 class ClientFactory(DjangoModelFactory):
@@ -738,7 +846,7 @@ class ClientFactory(DjangoModelFactory):
     Note: Make sure to have the 'django_model_factory' package installed to use this class.
     """
     class Meta:
-        model = 'contrib.Client'
+        model = Client
 
 
 class ClientTrackInfoFactory(DjangoModelFactory):
@@ -758,7 +866,7 @@ class ClientTrackInfoFactory(DjangoModelFactory):
             client_track_info = ClientTrackInfoFactory()
     """
     class Meta:
-        model = 'contrib.ClientTrackInfo'
+        model = ClientTrackInfo
 
 
 class NotificationFactory(DjangoModelFactory):
@@ -766,7 +874,7 @@ class NotificationFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'notification.Notification'
+        model = Notification
 
 
 class ExtractionQueryFactory(DjangoModelFactory):
@@ -800,7 +908,7 @@ class ExtractionQueryFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'extraction.ExtractionQuery'
+        model = ExtractionQuery
 
 
 class OSMNameFactory(DjangoModelFactory):
@@ -812,10 +920,8 @@ class OSMNameFactory(DjangoModelFactory):
     Attributes:
         display_name (factory.Sequence): A factory attribute that generates a sequence of display names
             in the format 'osm-name-n', where n is a unique identifier.
-        lat (factory.Faker('pyint', min_value=100, max_value=200)): A factory attribute that generates a
-            random latitude value between 100 and 200.
-        lon (factory.Faker('pyint', min_value=100, max_value=200)): A factory attribute that generates a
-            random longitude value between 100 and 200.
+        lat (factory.Sequence): A factory attribute that generates a latitude value between 100 and 200.
+        lon (factory.Sequence): A factory attribute that generates a longitude value between 100 and 200.
         identifier (factory.Iterator): A factory attribute that iterates over the list of OSMName.IDENTIFIER
             values to generate unique identifiers.
         accuracy (factory.Iterator): A factory attribute that iterates over the list of OSMName.OSM_ACCURACY
@@ -826,14 +932,14 @@ class OSMNameFactory(DjangoModelFactory):
             The Meta inner class specifies the model that this factory class is associated with.
 
     """
-    display_name = factory.Sequence(lambda n: f'osm-name-{n}')
-    lat = factory.Faker('pyint', min_value=100, max_value=200)
-    lon = factory.Faker('pyint', min_value=100, max_value=200)
+    display_name = factory.Sequence(_seq_display_name)
+    lat = factory.Sequence(_seq_lat)
+    lon = factory.Sequence(_seq_lon)
     identifier = factory.Iterator(OSMName.IDENTIFIER)
     accuracy = factory.Iterator(OSMName.OSM_ACCURACY)
 
     class Meta:
-        model = 'entry.OSMName'
+        model = OSMName
 
 
 class HouseholdSizeFactory(DjangoModelFactory):
@@ -848,4 +954,4 @@ class HouseholdSizeFactory(DjangoModelFactory):
 
     """
     class Meta:
-        model = 'country.HouseholdSize'
+        model = HouseholdSize
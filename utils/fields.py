@@ -1,15 +1,35 @@
-import bleach
-import django
+import hashlib
+import re
+import threading
+from bleach.sanitizer import Cleaner
 from django.conf import settings
 from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.core.files.storage import get_storage_class, default_storage
-from django.db.models import FileField, TextField
+from django.db.models import Field, FileField, TextField
 from django.db.models.fields.files import FieldFile
 from html import unescape
 
 from helix.storages import FileSystemMediaStorage
 
 StorageClass = get_storage_class()
+# Only file system media urls are relative and need the backend base url to be absolute
+ABSOLUTE_MEDIA_URL_PREFIX = settings.BACKEND_BASE_URL if StorageClass is FileSystemMediaStorage else ''
+
+# Characters for which bleach (html5lib) output can differ from the input
+# NOTE: Besides markup and entities, html5lib also normalizes \r and replaces/drops C0 control characters
+HTML_SIGNIFICANT_CHARS_RE = re.compile(r'[<&\x00-\x08\x0b-\x1f]')
+
+# NOTE: bleach Cleaner is not thread-safe (the html parser keeps state), so one is kept per thread
+_bleach_local = threading.local()
+
+
+def get_bleach_cleaner() -> Cleaner:
+    cleaner = getattr(_bleach_local, 'cleaner', None)
+    if cleaner is None:
+        cleaner = _bleach_local.cleaner = Cleaner(strip=True)
+    return cleaner
 
 
 def generate_full_media_url(path, absolute=False):
@@ -33,13 +53,34 @@ def generate_full_media_url(path, absolute=False):
     """
     if not path:
         return ''
-    url = default_storage.url(str(path))
-    if StorageClass == FileSystemMediaStorage:
-        if absolute:
-            return f'{settings.BACKEND_BASE_URL}{url}'
+    url = default_storage.url(path if isinstance(path, str) else str(path))
+    if absolute:
+        return ABSOLUTE_MEDIA_URL_PREFIX + url
     return url
 
 
+def _get_cached_url_settings():
+    # (Are urls cached (signed S3 urls), cache timeout)
+    return (
+        (
+            settings.DEFAULT_FILE_STORAGE == 'storages.backends.s3boto3.S3Boto3Storage' and
+            getattr(settings, 'AWS_QUERYSTRING_AUTH', False) is not False
+        ),
+        getattr(settings, 'AWS_QUERYSTRING_EXPIRE', 3600),
+    )
+
+
+CACHED_URL_SETTINGS = _get_cached_url_settings()
+
+
+@receiver(setting_changed)
+def _update_cached_url_settings(setting, **kwargs):
+    # Keep in sync with override_settings
+    global CACHED_URL_SETTINGS
+    if setting in ('DEFAULT_FILE_STORAGE', 'AWS_QUERYSTRING_AUTH', 'AWS_QUERYSTRING_EXPIRE'):
+        CACHED_URL_SETTINGS = _get_cached_url_settings()
+
+
 class CachedFieldFile(FieldFile):
     """
 
@@ -56,6 +97,8 @@ class CachedFieldFile(FieldFile):
         URL is cached using the CACHE_KEY and returned. Otherwise, the URL is fetched using the super() method from
         FieldFile. If the URL is not found in the cache, it is fetched using the super() method and cached for future
         use.
+    - bulk_urls(files):
+        Same as url but for multiple files, using a single cache.get_many and a single cache.set_many for the misses.
 
     Example usage:
 
@@ -66,22 +109,54 @@ class CachedFieldFile(FieldFile):
 
     """
     CACHE_KEY = 'url_cache_{}'
+    # FieldFile.url getter, used as a method to skip the super() lookup
+    _parent_url = FieldFile.url.fget
+
+    @staticmethod
+    def is_url_cached():
+        return CACHED_URL_SETTINGS[0]
+
+    def get_cache_key(self):
+        # NOTE: hash(str) is randomized per process, use a digest so that all workers share the same key
+        return self.CACHE_KEY.format(
+            hashlib.blake2b(self.name.encode('utf-8'), digest_size=10).hexdigest()
+        )
 
     @property
     def url(self):
-        if (
-            settings.DEFAULT_FILE_STORAGE != 'storages.backends.s3boto3.S3Boto3Storage' or
-            getattr(settings, 'AWS_QUERYSTRING_AUTH', False) is False
-        ):
-            return super().url
-        key = self.CACHE_KEY.format(hash(self.name))
+        if not self.is_url_cached():
+            return self._parent_url()
+        key = self.get_cache_key()
         url = cache.get(key)
         if url:
             return url
-        url = super().url
-        cache.set(key, url, getattr(settings, 'AWS_QUERYSTRING_EXPIRE', 3600))
+        url = self._parent_url()
+        cache.set(key, url, CACHED_URL_SETTINGS[1])
         return url
 
+    @classmethod
+    def bulk_urls(cls, files):
+        """
+        Return the urls of `files` (in the same order), empty files resolve to None.
+        """
+        if not cls.is_url_cached():
+            return [file.url if file else None for file in files]
+        keys = [file.get_cache_key() if file else None for file in files]
+        cached_urls = cache.get_many([key for key in keys if key is not None])
+        missing_urls = {}
+        urls = []
+        for file, key in zip(files, keys):
+            if key is None:
+                urls.append(None)
+                continue
+            url = cached_urls.get(key) or missing_urls.get(key)
+            if not url:
+                url = missing_urls[key] = file._parent_url()
+            urls.append(url)
+        if missing_urls:
+            cache.set_many(missing_urls, CACHED_URL_SETTINGS[1])
+        return urls
+
 
 class CachedFileField(FileField):
     """
@@ -117,10 +192,17 @@ class BleachedTextField(TextField):
                 None.
     """
     def get_db_prep_value(self, *args, **kwargs):
-        value = super(TextField, self).get_db_prep_value(*args, **kwargs)
+        # NOTE: Same as super(TextField, self), TextField.get_db_prep_value is patched below
+        value = Field.get_db_prep_value(self, *args, **kwargs)
         if isinstance(value, str):
-            return unescape(bleach.clean(value, strip=True))
+            if HTML_SIGNIFICANT_CHARS_RE.search(value) is None:
+                # Nothing for bleach to strip, unescape(clean(value)) would return the same value
+                return value
+            # NOTE: unescape returns the cleaned string as is when bleach didn't encode anything (no '&' in it)
+            return unescape(get_bleach_cleaner().clean(value))
         return value
 
 
-django.db.models.TextField.get_db_prep_value = BleachedTextField.get_db_prep_value
+if not getattr(TextField, '_bleached', False):
+    TextField.get_db_prep_value = BleachedTextField.get_db_prep_value
+    TextField._bleached = True
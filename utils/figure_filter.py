@@ -7,6 +7,7 @@ from django.utils.translation import gettext
 from django.db import models
 from django.http import HttpRequest
 
+from utils.common import to_hashable
 from utils.filters import SimpleInputFilter, generate_type_for_filter_set
 from apps.report.models import Report
 from apps.country.models import Country
@@ -19,21 +20,61 @@ from apps.extraction.filters import (
 )
 
 
+# Report columns required to generate the report figures (see QueryAbstractModel.get_filter_kwargs)
+REPORT_FIGURE_FILTER_FIELDS = (
+    'id',
+    *(
+        field.name
+        for field in Report._meta.concrete_fields
+        if field.name.startswith('filter_')
+    ),
+)
+
+
+# Figure field referencing the filtered model, used by `by figure filter`
+MODEL_FIGURE_OUTER_REF_FIELD = {
+    Country: 'country',
+    Event: 'event',
+    Crisis: 'event__crisis',
+}
+
+
 class FigureFilterHelper:
     """
 
     """
+    @staticmethod
+    def get_figure_qs(filters: dict, request: HttpRequest) -> models.QuerySet:
+        """
+        Return ReportFigureExtractionFilterSet(...).qs for the filters, memoized on the request.
+
+        The same figure filters are used by multiple filters/annotations within a request.
+        """
+        if request is None:
+            return ReportFigureExtractionFilterSet(data=filters, request=request).qs
+        try:
+            cache_key = to_hashable(filters)
+            hash(cache_key)
+        except TypeError:
+            # NOTE: Not memoized, an id() key can be reused by another filters object once this one is collected
+            return ReportFigureExtractionFilterSet(data=filters, request=request).qs
+        figure_qs_cache = getattr(request, '_figure_qs_cache', None)
+        if figure_qs_cache is None:
+            figure_qs_cache = request._figure_qs_cache = {}
+        if cache_key not in figure_qs_cache:
+            figure_qs_cache[cache_key] = ReportFigureExtractionFilterSet(data=filters, request=request).qs
+        return figure_qs_cache[cache_key]
+
     @staticmethod
     def get_report_id_from_filter_data(aggregate_figures_filter: typing.Optional[dict]) -> typing.Optional[int]:
-        return (
-            (
-                aggregate_figures_filter or {}
-            ).get('filter_figures') or {}
-        ).get('report_id')
+        if not aggregate_figures_filter:
+            return None
+        figure_filters = aggregate_figures_filter.get('filter_figures')
+        return figure_filters.get('report_id') if figure_filters else None
 
     @staticmethod
     def get_report(report_id: int) -> Report:
-        report = Report.objects.filter(id=report_id).first()
+        report = Report.objects.only(*REPORT_FIGURE_FILTER_FIELDS).filter(id=report_id).first()
         if report is None:
             raise ValidationError(gettext('Provided Report does not exist'))
         return report
@@ -42,20 +83,16 @@ class FigureFilterHelper:
     def filter_using_figure_filters(qs: models.QuerySet, filters: dict, request: HttpRequest) -> models.QuerySet:
         if not filters:
             return qs
-        figure_qs = ReportFigureExtractionFilterSet(data=filters, request=request).qs
-        outer_ref_field = None
-        if qs.model is Country:
-            outer_ref_field = 'country'
-        elif qs.model is Event:
-            outer_ref_field = 'event'
-        elif qs.model is Crisis:
-            outer_ref_field = 'event__crisis'
-
+        figure_qs = FigureFilterHelper.get_figure_qs(filters, request)
+        outer_ref_field = MODEL_FIGURE_OUTER_REF_FIELD.get(qs.model)
         if outer_ref_field is None:
             raise Exception(f'Unknown model used for `by figure filter`. {qs.model}')
 
+        # NOTE: EXISTS lets postgres stop at the first matching figure instead of materializing IN (...)
         return qs.filter(
-            id__in=figure_qs.values(outer_ref_field)
+            models.Exists(
+                figure_qs.filter(**{outer_ref_field: models.OuterRef('pk')}).values('pk')
+            )
         )
 
     @classmethod
@@ -70,7 +107,7 @@ class FigureFilterHelper:
         report_id = cls.get_report_id_from_filter_data(aggregate_figures_filter)
         report = report_id and cls.get_report(report_id)
 
-        figure_filters = (aggregate_figures_filter or {}).get('filter_figures') or {}
+        figure_filters = aggregate_figures_filter and aggregate_figures_filter.get('filter_figures')
         figure_qs = None
         reference_date = None
         if report:
@@ -78,7 +115,7 @@ class FigureFilterHelper:
             reference_date = report.filter_figure_end_before
 
         if figure_filters:
-            figure_qs = ReportFigureExtractionFilterSet(data=figure_filters, request=request).qs
+            figure_qs = cls.get_figure_qs(figure_filters, request)
 
         return figure_qs, reference_date
 
@@ -114,13 +151,16 @@ class CountryFigureAggregateFilter(FigureAggregateFilter):
     year = django_filters.NumberFilter(method='noop')
 
 
+# Shared by the aggregate filter data types below
+FIGURE_EXTRACTION_FILTER_DATA_FIELD = graphene.Field(FigureExtractionFilterDataType)
+
 FigureAggregateFilterDataType, FigureAggregateFilterDataInputType = generate_type_for_filter_set(
     FigureAggregateFilter,
     'entry.schema.figure_list',
     'FigureAggregateFilterDataType',
     'FigureAggregateFilterDataInputType',
     custom_new_fields_map={
-        'filter_figures': graphene.Field(FigureExtractionFilterDataType),
+        'filter_figures': FIGURE_EXTRACTION_FILTER_DATA_FIELD,
     },
 )
 
@@ -130,6 +170,6 @@ CountryFigureAggregateFilterDataType, CountryFigureAggregateFilterDataInputType
     'CountryFigureAggregateFilterDataType',
     'CountryFigureAggregateFilterDataInputType',
     custom_new_fields_map={
-        'filter_figures': graphene.Field(FigureExtractionFilterDataType),
+        'filter_figures': FIGURE_EXTRACTION_FILTER_DATA_FIELD,
     },
 )
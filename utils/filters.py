@@ -1,16 +1,14 @@
 import typing
 import graphene
 import django_filters
-from functools import partial
 from django import forms
-from django.db.models.functions import Lower, StrIndex
+from django.conf import settings
+from django.db.models.functions import StrIndex, Upper
 from django.db.models import Value
 from django.db.models.query import QuerySet
-from graphene.types.generic import GenericScalar
-from graphene_django.forms.converter import convert_form_field
-from graphene_django.filter.utils import get_filtering_args_from_filterset
 
-from utils.mutation import generate_object_field_from_input_type, compare_input_output_type_fields
+# NOTE: graphene_django and utils.mutation (which pulls DRF and the serializer converters) are imported where used,
+# so that importing this module for plain django filters stays cheap.
 
 
 class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
@@ -43,18 +41,21 @@ class DjangoFilterCSVWidget(django_filters.widgets.CSVWidget):
 
     """
     def value_from_datadict(self, data, files, name):
-        value = forms.Widget.value_from_datadict(self, data, files, name)
-
-        if value is not None:
-            if value == '':  # parse empty value as an empty list
-                return []
-            # if value is already list(by POST)
-            elif isinstance(value, list) or isinstance(value, QuerySet):
-                return value
-            elif isinstance(value, str):
-                return [x.strip() for x in value.strip().split(',') if x.strip()]
-            raise Exception(f'Unknown value type {type(value)}')
-        return None
+        # NOTE: Same as forms.Widget.value_from_datadict
+        value = data.get(name)
+
+        # if value is already list(by POST), most common for graphql filters
+        if type(value) is list:
+            return value
+        if value is None:
+            return None
+        if value == '':  # parse empty value as an empty list
+            return []
+        elif isinstance(value, (list, QuerySet)):
+            return value
+        elif isinstance(value, str):
+            return [x.strip() for x in value.strip().split(',') if x.strip()]
+        raise Exception(f'Unknown value type {type(value)}')
 
 
 def _generate_filter_class(inner_type, filter_type=None, non_null=False):
@@ -86,9 +87,16 @@ def _generate_filter_class(inner_type, filter_type=None, non_null=False):
     fields to graphene types. If non_null is True, the inner_type is wrapped in graphene.NonNull. Otherwise, the
     inner_type is used as is.
 
-    Note that the generated filter class is not returned as a string, but as a Python class object.
+    Note that the generated filter class is not returned as a string, but as a Python class object. The generated
+    classes are cached by (inner_type, filter_type, non_null), so the form field is only registered once.
 
     """
+    from graphene_django.forms.converter import convert_form_field
+
+    cache_key = (inner_type, filter_type, non_null)
+    if cache_key in _generate_filter_class.cache:
+        return _generate_filter_class.cache[cache_key]
+
     _filter_type = filter_type or django_filters.Filter
     form_field = type(
         "{}FormField".format(inner_type.__name__),
@@ -111,9 +119,13 @@ def _generate_filter_class(inner_type, filter_type=None, non_null=False):
         lambda _: graphene.NonNull(inner_type) if non_null else inner_type()
     )
 
+    _generate_filter_class.cache[cache_key] = filter_class
     return filter_class
 
 
+_generate_filter_class.cache = {}
+
+
 def _generate_list_filter_class(inner_type, filter_type=None, field_class=None):
     """
     Generates a list filter class for filtering List({inner_type}) arguments using FilterSets.
@@ -126,7 +138,13 @@ def _generate_list_filter_class(inner_type, filter_type=None, field_class=None):
 
     The generated list filter class is a small extension of the raw filter_type that allows expressing graphql
     List({inner_type}) arguments using FilterSets. The given values are passed directly into queryset filters.
+    The generated classes are cached by (inner_type, filter_type, field_class).
     """
+    from graphene_django.forms.converter import convert_form_field
+
+    cache_key = (inner_type, filter_type, field_class)
+    if cache_key in _generate_list_filter_class.cache:
+        return _generate_list_filter_class.cache[cache_key]
 
     _filter_type = filter_type or django_filters.Filter
     _field_class = field_class or _filter_type.field_class
@@ -151,9 +169,13 @@ def _generate_list_filter_class(inner_type, filter_type=None, field_class=None):
         lambda _: graphene.List(graphene.NonNull(inner_type))
     )
 
+    _generate_list_filter_class.cache[cache_key] = filter_class
     return filter_class
 
 
+_generate_list_filter_class.cache = {}
+
+
 def _get_simple_input_filter(_type, **kwargs):
     """
     Return an instance of a filter class based on the given type.
@@ -229,12 +251,17 @@ def generate_type_for_filter_set(
     if filter_set in generate_type_for_filter_set.cache:
         return generate_type_for_filter_set.cache[filter_set]
 
+    from graphene_django.filter.utils import get_filtering_args_from_filterset
+    from utils.mutation import generate_object_field_from_input_type, compare_input_output_type_fields
+
     def generate_type_from_input_type(input_type):
         new_fields_map = generate_object_field_from_input_type(input_type)
         if custom_new_fields_map:
             new_fields_map.update(custom_new_fields_map)
         new_type = type(type_name, (graphene.ObjectType,), new_fields_map)
-        compare_input_output_type_fields(input_type, new_type)
+        # NOTE: Only a sanity check for development, custom fields which are not in the input type can't match
+        if settings.DEBUG and not (set(custom_new_fields_map or ()) - set(input_type._meta.fields)):
+            compare_input_output_type_fields(input_type, new_type)
         return new_type
 
     input_type = type(
@@ -252,34 +279,63 @@ generate_type_for_filter_set.cache = {}
 SimpleInputFilter = _get_simple_input_filter
 MultipleInputFilter = _get_multiple_input_filter
 
-IDFilter = _generate_filter_class(
-    graphene.ID,
-    filter_type=django_filters.NumberFilter,
-)
 
-# Generic Filters
-IDListFilter = _generate_list_filter_class(graphene.ID)
+def _generate_generic_filter():
+    from graphene.types.generic import GenericScalar
+    return _generate_filter_class(GenericScalar)
+
+
+# Generic Filters, generated on first access (see __getattr__)
+LAZY_FILTER_GENERATORS = {
+    'IDFilter': lambda: _generate_filter_class(
+        graphene.ID,
+        filter_type=django_filters.NumberFilter,
+    ),
+    'IDListFilter': lambda: _generate_list_filter_class(graphene.ID),
+    'StringListFilter': lambda: _generate_list_filter_class(graphene.String),
+    'GenericFilter': _generate_generic_filter,
+}
+
+
+def __getattr__(name):
+    # PEP 562: Generate the filter once and keep it as a module attribute for the next lookups
+    if name in LAZY_FILTER_GENERATORS:
+        value = globals()[name] = LAZY_FILTER_GENERATORS[name]()
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+ISO_8601_INPUT_FORMATS = (django_filters.fields.IsoDateTimeField.ISO_8601,)
+
+
+class DateTimeFilter(django_filters.DateTimeFilter):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('input_formats', ISO_8601_INPUT_FORMATS)
+        super().__init__(*args, **kwargs)
+
+
+class DateTimeGteFilter(DateTimeFilter):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('lookup_expr', 'gte')
+        super().__init__(*args, **kwargs)
+
+
+class DateTimeLteFilter(DateTimeFilter):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('lookup_expr', 'lte')
+        super().__init__(*args, **kwargs)
+
 
-StringListFilter: MultipleInputFilter = _generate_list_filter_class(graphene.String)
-GenericFilter = _generate_filter_class(GenericScalar)
+class DateGteFilter(django_filters.DateFilter):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('lookup_expr', 'gte')
+        super().__init__(*args, **kwargs)
 
-DateTimeFilter = partial(
-    django_filters.DateTimeFilter,
-    input_formats=[django_filters.fields.IsoDateTimeField.ISO_8601],
-)
-DateTimeGteFilter = partial(
-    django_filters.DateTimeFilter,
-    lookup_expr='gte',
-    input_formats=[django_filters.fields.IsoDateTimeField.ISO_8601],
-)
-DateTimeLteFilter = partial(
-    django_filters.DateTimeFilter,
-    lookup_expr='lte',
-    input_formats=[django_filters.fields.IsoDateTimeField.ISO_8601],
-)
 
-DateGteFilter = partial(django_filters.DateFilter, lookup_expr='gte')
-DateLteFilter = partial(django_filters.DateFilter, lookup_expr='lte')
+class DateLteFilter(django_filters.DateFilter):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('lookup_expr', 'lte')
+        super().__init__(*args, **kwargs)
 
 
 class NameFilterMixin:
@@ -302,8 +358,12 @@ class NameFilterMixin:
     def _filter_name(self, queryset, name, value):
         if not value:
             return queryset
-        return queryset.annotate(
-            lname=Lower('name')
+        # NOTE: Filter using icontains first, postgres can use a trigram index on UPPER(name) for it if available.
+        # eg: CREATE INDEX CONCURRENTLY <table>_name_upper_trgm_idx ON <table> USING gin (UPPER(name) gin_trgm_ops);
+        # On postgres icontains is `UPPER(name) LIKE UPPER(value)`, so the position used for the ordering is computed
+        # with the same UPPER folding on both sides, otherwise a matched row could get a position of 0.
+        return queryset.filter(
+            name__icontains=value,
         ).annotate(
-            idx=StrIndex('lname', Value(value.lower()))
-        ).filter(idx__gt=0).order_by('idx', 'name')
+            idx=StrIndex(Upper('name'), Upper(Value(value)))
+        ).order_by('idx', 'name')
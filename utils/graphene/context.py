@@ -38,7 +38,8 @@ from apps.event.dataloaders import (
     EventCodeLoader,
     EventCrisisLoader,
 )
-from utils.graphene.dataloaders import OneToManyLoader, CountLoader
+from utils.graphene.dataloaders import OneToManyLoader, CountLoader, PaginatedListLoader, CachedFileUrlLoader
+from apps.crisis.models import Crisis
 from apps.entry.models import Figure
 from apps.users.dataloaders import UserPortfoliosMetadataLoader
 from apps.organization.dataloaders import OrganizationCountriesLoader, OrganizationOrganizationKindLoader
@@ -56,12 +57,19 @@ class GQLContext:
         request (HttpRequest): The request object for the current request.
         one_to_many_dataloaders (dict): A dictionary to store OneToManyLoader objects for different references.
         count_dataloaders (dict): A dictionary to store CountLoader objects for different references.
+        paginated_list_dataloaders (dict): A dictionary to store PaginatedListLoader objects for different references.
+        resolver_cache (dict): A dictionary to store values computed by resolvers for the current request.
 
     Methods:
         user(): Returns the user object associated with the current request.
         get_dataloader(parent: str, related_name: str): Returns a OneToManyLoader object for the given parent and
         related name.
         get_count_loader(parent: str, child: str): Returns a CountLoader object for the given parent and child.
+        get_paginated_list_loader(parent: str, related_name: str): Returns a PaginatedListLoader object for the given
+        parent and related name.
+        cache_get_or_set(key, factory): Returns the value cached for the key in the current request, computed with
+        factory() on the first call.
+        load_absolute_file_url(file): Returns a promise of the absolute url of the file (None for an empty file).
         entry_entry_total_stock_idp_figures(): Returns a TotalIDPFigureByEntryLoader object.
         entry_entry_total_flow_nd_figures(): Returns a TotalNDFigureByEntryLoader object.
         crisis_crisis_total_stock_idp_figures(): Returns a TotalIDPFigureByCrisisLoader object.
@@ -100,12 +108,16 @@ class GQLContext:
         organization_organization_kind_loader(): Returns an OrganizationOrganizationKindLoader object.
         entry_preview_loader(): Returns an EntryPreviewLoader object.
         user_portfolios_metadata(): Returns a UserPortfoliosMetadataLoader object.
+        cached_file_url_loader(): Returns a CachedFileUrlLoader object.
     """
     def __init__(self, request):
         self.request = request
         # global dataloaders
         self.one_to_many_dataloaders = {}
         self.count_dataloaders = {}
+        self.paginated_list_dataloaders = {}
+        # request scoped cache for resolvers (see cache_get_or_set)
+        self.resolver_cache = {}
 
     @cached_property
     def user(self):
@@ -125,6 +137,24 @@ class GQLContext:
             self.count_dataloaders[ref] = CountLoader()
         return self.count_dataloaders[ref]
 
+    def get_paginated_list_loader(self, parent: str, related_name: str):
+        ref = f'{parent}_{related_name}'
+        if ref not in self.paginated_list_dataloaders:
+            self.paginated_list_dataloaders[ref] = PaginatedListLoader()
+        return self.paginated_list_dataloaders[ref]
+
+    def cache_get_or_set(self, key, factory):
+        # NOTE: Only for values which don't change within a request, e.g. key: (obj.id, 'field_name')
+        if key not in self.resolver_cache:
+            self.resolver_cache[key] = factory()
+        return self.resolver_cache[key]
+
+    def load_absolute_file_url(self, file):
+        # NOTE: Empty files resolve to None, build_absolute_uri(None) would return the current request url
+        return self.cached_file_url_loader.load(file).then(
+            lambda url: url and self.request.build_absolute_uri(url)
+        )
+
     '''
     NOTE: As a convention, data loader should have the name as:
     AppName_NodeType_FieldName
@@ -164,7 +194,6 @@ class GQLContext:
 
     @cached_property
     def country_country_this_year_idps_disaster_loader(self):
-        from apps.crisis.models import Crisis
         return TotalFigureThisYearByCountryCategoryEventTypeLoader(
             category=Figure.FIGURE_CATEGORY_TYPES.IDPS,
             event_type=Crisis.CRISIS_TYPE.DISASTER.value,
@@ -172,7 +201,6 @@ class GQLContext:
 
     @cached_property
     def country_country_this_year_idps_conflict_loader(self):
-        from apps.crisis.models import Crisis
         return TotalFigureThisYearByCountryCategoryEventTypeLoader(
             category=Figure.FIGURE_CATEGORY_TYPES.IDPS,
             event_type=Crisis.CRISIS_TYPE.CONFLICT.value,
@@ -180,7 +208,6 @@ class GQLContext:
 
     @cached_property
     def country_country_this_year_nd_conflict_loader(self):
-        from apps.crisis.models import Crisis
         return TotalFigureThisYearByCountryCategoryEventTypeLoader(
             category=Figure.FIGURE_CATEGORY_TYPES.NEW_DISPLACEMENT,
             event_type=Crisis.CRISIS_TYPE.CONFLICT.value,
@@ -188,7 +215,6 @@ class GQLContext:
 
     @cached_property
     def country_country_this_year_nd_disaster_loader(self):
-        from apps.crisis.models import Crisis
         return TotalFigureThisYearByCountryCategoryEventTypeLoader(
             category=Figure.FIGURE_CATEGORY_TYPES.NEW_DISPLACEMENT,
             event_type=Crisis.CRISIS_TYPE.DISASTER.value,
@@ -281,3 +307,7 @@ class GQLContext:
     @cached_property
     def user_portfolios_metadata(self):
         return UserPortfoliosMetadataLoader()
+
+    @cached_property
+    def cached_file_url_loader(self):
+        return CachedFileUrlLoader()
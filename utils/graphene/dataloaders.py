@@ -1,15 +1,22 @@
 from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
 
 from promise import Promise
 from promise.dataloader import DataLoader
 from django.db.models import (
-    Prefetch,
+    F,
     Subquery,
     OuterRef,
     Count,
-    IntegerField,
 )
 
+from utils.common import to_hashable
+from utils.fields import CachedFieldFile
+
+
+LOADER_MAX_BATCH_SIZE = 1000
+
 
 def get_relations(model1, model2):
     """
@@ -29,6 +36,8 @@ def get_relations(model1, model2):
     return relations
 
 
+# NOTE: Model relations don't change at runtime
+@lru_cache(maxsize=None)
 def get_related_name(model1, model2):
     """
     Returns the related name between two models.
@@ -46,6 +55,30 @@ def get_related_name(model1, model2):
         return relations[0]
 
 
+def get_filtered_queryset(filterset_class, filter_kwargs, request):
+    """
+    Return filterset_class(data=filter_kwargs, request=request).qs, memoized on the request.
+
+    The same filters are used by the count and the list loaders of a field (and by every parent type using it), so
+    the filterset is only validated once per request. The returned queryset is shared, only use it to chain new
+    querysets.
+    """
+    if request is None:
+        return filterset_class(data=filter_kwargs, request=request).qs
+    try:
+        cache_key = (filterset_class, to_hashable(filter_kwargs))
+        hash(cache_key)
+    except TypeError:
+        # NOTE: Not memoized, an id() key can be reused by another filters object once this one is collected
+        return filterset_class(data=filter_kwargs, request=request).qs
+    filtered_qs_cache = getattr(request, '_loader_filtered_qs_cache', None)
+    if filtered_qs_cache is None:
+        filtered_qs_cache = request._loader_filtered_qs_cache = {}
+    if cache_key not in filtered_qs_cache:
+        filtered_qs_cache[cache_key] = filterset_class(data=filter_kwargs, request=request).qs
+    return filtered_qs_cache[cache_key]
+
+
 class DataLoaderException(Exception):
     """
 
@@ -68,6 +101,7 @@ class CountLoader(DataLoader):
     Methods:
     - load: Loads the count of related objects for the given parent and child models.
     - batch_load_fn: Retrieves the count of related objects for multiple parent keys.
+    - get_counts: Returns the count of related objects for each of the parent keys.
 
     Attributes:
     - parent: The parent model.
@@ -82,6 +116,9 @@ class CountLoader(DataLoader):
     - kwargs: Additional kwargs passed for pagination.
 
     """
+    # NOTE: Large batches are split into multiple queries, to keep the IN lists bounded
+    max_batch_size = LOADER_MAX_BATCH_SIZE
+
     def load(
         self,
         key,
@@ -110,34 +147,28 @@ class CountLoader(DataLoader):
         return super().load(key)
 
     def batch_load_fn(self, keys):
+        return Promise.resolve(self.get_counts(keys))
+
+    def get_counts(self, keys):
         # queryset by related names
         reverse_related_name = self.reverse_related_name or get_related_name(self.child, self.parent)
 
-        filtered_qs = self.filterset_class(
-            data=self.filter_kwargs,
-            request=self.request
-        ).qs
+        filtered_qs = get_filtered_queryset(self.filterset_class, self.filter_kwargs, self.request)
 
-        qs = self.parent.objects.filter(
-            id__in=keys
+        # NOTE: One grouped aggregate over the children, instead of a correlated count subquery for each parent
+        qs = filtered_qs.filter(**{
+            f'{reverse_related_name}__in': keys
+        }).order_by().values(
+            reverse_related_name
         ).annotate(
-            count=Subquery(
-                filtered_qs.filter(**{
-                    reverse_related_name: OuterRef('pk')
-                }).order_by().values(
-                    reverse_related_name
-                ).annotate(
-                    c=Count('*')
-                ).values('c'),
-                output_field=IntegerField()
-            )
-        ).values_list('id', 'count')
+            c=Count('*')
+        ).values_list(reverse_related_name, 'c')
 
-        related_objects_by_parent = {id_: count for id_, count in qs}
+        # NOTE: Parents without any child default to 0
+        related_objects_by_parent = defaultdict(int)
+        related_objects_by_parent.update(qs)
 
-        return Promise.resolve([
-            related_objects_by_parent.get(key) or 0 for key in keys
-        ])
+        return list(map(related_objects_by_parent.__getitem__, keys))
 
 
 class OneToManyLoader(DataLoader):
@@ -166,7 +197,13 @@ class OneToManyLoader(DataLoader):
     - batch_load_fn(keys):
       Loads the related objects for the batch of keys and returns the result.
 
+    - get_related_objects(keys):
+      Returns the list of related objects for each of the keys.
+
     """
+    # NOTE: Large batches are split into multiple queries, to keep the IN lists bounded
+    max_batch_size = LOADER_MAX_BATCH_SIZE
+
     def load(
         self,
         key,
@@ -195,17 +232,20 @@ class OneToManyLoader(DataLoader):
         return super().load(key)
 
     def batch_load_fn(self, keys):
+        return Promise.resolve(self.get_related_objects(keys))
+
+    def get_related_objects(self, keys):
         related_objects_by_parent = defaultdict(list)
 
         # queryset by related names
-        related_name = self.related_name or get_related_name(self.parent, self.child)
         reverse_related_name = self.reverse_related_name or get_related_name(self.child, self.parent)
 
         # pre-ready the filtered and paginated queryset
-        filtered_qs = self.filterset_class(
-            data=self.filter_kwargs,
-            request=self.request,
-        ).qs.filter(**{
+        filtered_qs = get_filtered_queryset(
+            self.filterset_class,
+            self.filter_kwargs,
+            self.request,
+        ).filter(**{
             reverse_related_name: OuterRef(reverse_related_name)
         })
         filtered_paginated_qs = self.pagination.paginate_queryset(
@@ -213,24 +253,51 @@ class OneToManyLoader(DataLoader):
             **self.kwargs
         ).values('id')
 
-        OUT_RELATED_FIELD = 'out_related_field'
+        OUT_PARENT_FIELD = 'out_parent_id'
+
+        # NOTE: The children are fetched directly with their parent id, the parents themselves are not needed.
+        # Both lookups are in the same filter call so that they share the join for many to many relations.
+        qs = self.child.objects.filter(**{
+            f'{reverse_related_name}__in': keys,
+            'id__in': Subquery(filtered_paginated_qs),
+        }).annotate(**{
+            OUT_PARENT_FIELD: F(reverse_related_name),
+        })
 
-        prefetch = Prefetch(
-            related_name,
-            queryset=self.child.objects.filter(
-                id__in=Subquery(
-                    filtered_paginated_qs
-                )
-            ).distinct(),
-            to_attr=OUT_RELATED_FIELD,
-        )
+        # NOTE: The children are only grouped here, no need to keep the queryset's result cache
+        get_parent_id = attrgetter(OUT_PARENT_FIELD)
+        for each in qs.iterator(chunk_size=2000):
+            related_objects_by_parent[get_parent_id(each)].append(each)
 
-        # FIXME: this prefetch is causing un-necessary join in generated queries
-        qs = self.parent.objects.filter(id__in=keys).prefetch_related(prefetch)
+        return list(map(related_objects_by_parent.__getitem__, keys))
 
-        for each in qs:
-            related_objects_by_parent[each.id] = getattr(each, OUT_RELATED_FIELD)
 
-        return Promise.resolve([
-            related_objects_by_parent.get(key, []) for key in keys
-        ])
+class PaginatedListLoader(OneToManyLoader):
+    """
+
+    Class PaginatedListLoader
+
+    A OneToManyLoader which also counts the related objects, each key resolves to (related objects, count).
+
+    Used by the paginated list fields, so that each parent needs a single load (and promise) for both the page and
+    the total count.
+
+    """
+    get_counts = CountLoader.get_counts
+
+    def batch_load_fn(self, keys):
+        return Promise.resolve(list(zip(
+            self.get_related_objects(keys),
+            self.get_counts(keys),
+        )))
+
+
+class CachedFileUrlLoader(DataLoader):
+    """
+    Resolve the urls of CachedFieldFile objects in a batch.
+
+    All the files requested while resolving a response share one cache.get_many (and one cache.set_many for the
+    misses), instead of a cache round trip for each file. Empty files resolve to None.
+    """
+    def batch_load_fn(self, keys):
+        return Promise.resolve(CachedFieldFile.bulk_urls(keys))
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 
 import graphene
@@ -7,6 +8,7 @@ from django.db import models
 from django.contrib.postgres.fields import ArrayField
 
 
+@lru_cache(maxsize=None)
 def to_camelcase(snake_str):
     """
     Converts a snake case string to camel case.
@@ -73,17 +75,31 @@ def convert_enum_to_graphene_enum(enum, name=None, description=enum_description,
 
     Note: This method creates a new type dynamically based on the provided Python enum. It uses the enum's name and
     docstring as the name and description of the Graphene enum. The Graphene enum will have the same values and
-    attributes as the Python enum.
+    attributes as the Python enum. The generated type is cached, converting the same enum again (with the same
+    arguments) returns the same Graphene enum.
     """
     description = description or enum.__doc__
     name = name or enum.__name__
+    cache_key = (enum, name, description, deprecation_reason)
+    if cache_key in convert_enum_to_graphene_enum.cache:
+        return convert_enum_to_graphene_enum.cache[cache_key]
     meta_dict = {
         "enum": enum,
         "description": description,
         "deprecation_reason": deprecation_reason,
     }
     meta_class = type("Meta", (object,), meta_dict)
-    return type(name, (graphene.Enum,), {"Meta": meta_class})
+    graphene_enum = type(name, (graphene.Enum,), {"Meta": meta_class})
+    convert_enum_to_graphene_enum.cache[cache_key] = graphene_enum
+    return graphene_enum
+
+
+convert_enum_to_graphene_enum.cache = {}
+
+
+@lru_cache(maxsize=None)
+def _get_enum_name(model_name: str, field_name: str) -> str:
+    return f'{model_name}{to_camelcase(field_name.title())}'
 
 
 def get_enum_name_from_django_field(
@@ -151,7 +167,7 @@ def get_enum_name_from_django_field(
             field_name = field.field.name
     if model_name is None or field_name is None:
         raise Exception(f'{field=} | {type(field)=}: Both {model_name=} and {field_name=} should have a value')
-    return f'{model_name}{to_camelcase(field_name.title())}'
+    return _get_enum_name(model_name, field_name)
 
 
 class EnumDescription(graphene.Scalar):
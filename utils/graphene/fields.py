@@ -1,14 +1,13 @@
 import logging
 import inspect
 import typing
-from functools import partial
+from functools import lru_cache, partial
 from collections import OrderedDict
 
 import graphene
 from django.db.models import QuerySet
 from django.core.exceptions import FieldError as DjFieldError
 from graphene import NonNull
-from graphene.types.structures import Structure
 from graphene.utils.str_converters import to_snake_case
 from graphene_django.utils import maybe_queryset, is_valid_django_model
 from graphene_django_extras import DjangoFilterPaginateListField
@@ -42,7 +41,20 @@ def path_has_list(info):
     Returns:
         bool: True if the path contains at least one numeric value, False otherwise.
     """
-    return bool([each for each in info.path if str(each).isdigit()])
+    # NOTE: graphql-core adds list indexes to the path as int, field names (str) can't be numeric
+    for each in info.path:
+        if type(each) is int:
+            return True
+    return False
+
+
+# NOTE: Orderings are client provided, but only a handful of them are used (bounded cache)
+@lru_cache(maxsize=256)
+def normalize_ordering(ordering):
+    """
+    Convert a comma separated camelCase ordering (e.g. "-createdAt, name") to django order_by fields (snake case).
+    """
+    return ','.join([to_snake_case(each) for each in ordering.strip(',').replace(' ', '').split(',')])
 
 
 class CustomDjangoListObjectBase(DjangoListObjectBase):
@@ -185,6 +197,9 @@ class CustomPaginatedListObjectField(DjangoFilterPaginateListField):
 
             self.pagination = pagination
             kwargs.update(**pagination_kwargs)
+        # NOTE: Constant for the field, checked once instead of on each resolve
+        self.has_page = hasattr(self.pagination, 'page')
+        self.results_field_name = _type._meta.results_field_name
 
         self.accessor = kwargs.pop('accessor', None)
         super(DjangoFilterPaginateListField, self).__init__(
@@ -195,7 +210,7 @@ class CustomPaginatedListObjectField(DjangoFilterPaginateListField):
         self, filterset_class, filtering_args, root, info, **kwargs
     ):
 
-        filter_kwargs = {k: v for k, v in kwargs.items() if k in filtering_args}
+        filter_kwargs = {k: kwargs[k] for k in filtering_args.keys() & kwargs.keys()}
         qs = getattr(root, self.accessor)
         if hasattr(qs, 'all'):
             qs = qs.all()
@@ -204,25 +219,22 @@ class CustomPaginatedListObjectField(DjangoFilterPaginateListField):
 
         if getattr(self, "pagination", None):
             ordering = kwargs.pop(self.pagination.ordering_param, None) or self.pagination.ordering
-            ordering = ','.join([to_snake_case(each) for each in ordering.strip(',').replace(' ', '').split(',')])
+            ordering = normalize_ordering(ordering)
             kwargs[self.pagination.ordering_param] = ordering
             qs = self.pagination.paginate_queryset(qs, **kwargs)
 
         return CustomDjangoListObjectBase(
             count=count,
             results=maybe_queryset(qs),
-            results_field_name=self.type._meta.results_field_name,
-            page=kwargs.get('page', 1) if hasattr(self.pagination, 'page') else None,
+            results_field_name=self.results_field_name,
+            page=kwargs.get('page', 1) if self.has_page else None,
             pageSize=kwargs.get(
                 'pageSize',
                 graphql_api_settings.DEFAULT_PAGE_SIZE
-            ) if hasattr(self.pagination, 'page') else None
+            ) if self.has_page else None
         )
 
     def get_resolver(self, parent_resolver):
-        current_type = self.type
-        while isinstance(current_type, Structure):
-            current_type = current_type.of_type
         return partial(
             self.list_resolver,
             self.filterset_class,
@@ -300,6 +312,10 @@ class DjangoPaginatedListObjectField(DjangoFilterPaginateListField):
 
             self.pagination = pagination
             kwargs.update(**pagination_kwargs)
+        # NOTE: Constant for the field, checked once instead of on each resolve
+        self.has_page_query_param = hasattr(self.pagination, 'page_query_param')
+        self.has_page_size_query_param = hasattr(self.pagination, 'page_size_query_param')
+        self.results_field_name = _type._meta.results_field_name
 
         if not kwargs.get("description", None):
             kwargs["description"] = "{} list".format(_type._meta.model.__name__)
@@ -315,6 +331,40 @@ class DjangoPaginatedListObjectField(DjangoFilterPaginateListField):
             _type, *args, **kwargs
         )
 
+    def get_list_object(self, results, count, kwargs):
+        return CustomDjangoListObjectBase(
+            results=results,
+            count=count,
+            results_field_name=self.results_field_name,
+            page=kwargs.get('page', 1) if self.has_page_query_param else None,
+            pageSize=kwargs.get(
+                'pageSize',
+                graphql_api_settings.DEFAULT_PAGE_SIZE
+            ) if self.has_page_size_query_param else None
+        )
+
+    def _resolve_count_and_page(self, qs, kwargs):
+        paginated_qs = self.pagination.paginate_queryset(
+            qs,
+            **kwargs
+        )
+        # NOTE: A first page which isn't full has all the rows, so the count query can be skipped
+        if (
+            isinstance(paginated_qs, QuerySet) and
+            paginated_qs.query.low_mark == 0 and
+            paginated_qs.query.high_mark is not None
+        ):
+            page_count = len(paginated_qs)
+            if page_count < paginated_qs.query.high_mark:
+                return paginated_qs, page_count
+        try:
+            # XXX: Experimental: Try to use 'id' to minimize joins in SQL Query
+            count = qs.values('id').count()
+        except DjFieldError:
+            # Fallback to normal count
+            count = qs.count()
+        return paginated_qs, count
+
     def list_resolver(
         self, manager, filterset_class, filtering_args, root, info, **kwargs
     ):
@@ -330,7 +380,7 @@ class DjangoPaginatedListObjectField(DjangoFilterPaginateListField):
         # setup pagination
         if getattr(self, "pagination", None):
             ordering = kwargs.pop(self.pagination.ordering_param, None) or self.pagination.ordering
-            ordering = ','.join([to_snake_case(each) for each in ordering.strip(',').replace(' ', '').split(',')])
+            ordering = normalize_ordering(ordering)
             kwargs[self.pagination.ordering_param] = ordering
 
         if root and path_has_list(info):
@@ -339,7 +389,8 @@ class DjangoPaginatedListObjectField(DjangoFilterPaginateListField):
             parent_class = root._meta.model
             child_class = manager.model
             # TODO: qs should be executed only when we access the results node in the future
-            qs = info.context.get_dataloader(
+            # NOTE: The page and the count are loaded together, one load (and promise) for each parent
+            return info.context.get_paginated_list_loader(
                 parent_class.__name__,
                 self.related_name,
             ).load(
@@ -354,22 +405,8 @@ class DjangoPaginatedListObjectField(DjangoFilterPaginateListField):
                 filter_kwargs=filter_kwargs,
                 request=info.context.request,
                 **kwargs,
-            )
-            count = info.context.get_count_loader(
-                parent_class.__name__,
-                child_class.__name__,
-            ).load(
-                root.id,
-                parent=parent_class,
-                child=child_class,
-                accessor=self.accessor,
-                related_name=self.related_name,
-                reverse_related_name=self.reverse_related_name,
-                pagination=self.pagination,
-                filterset_class=filterset_class,
-                filter_kwargs=filter_kwargs,
-                request=info.context.request,
-                **kwargs,
+            ).then(
+                lambda results_and_count: self.get_list_object(*results_and_count, kwargs)
             )
         else:
             accessor = self.accessor or self.related_name
@@ -386,28 +423,9 @@ class DjangoPaginatedListObjectField(DjangoFilterPaginateListField):
                     # NOTE: multiple field filters are returned when
                     # root and child are related in multiple ways
                     qs = qs.filter(**extra_filters)
-            try:
-                # XXX: Experimental: Try to use 'id' to minimize joins in SQL Query
-                count = qs.values('id').count()
-            except DjFieldError:
-                # Fallback to normal count
-                count = qs.count()
-
-            qs = self.pagination.paginate_queryset(
-                qs,
-                **kwargs
-            )
+            qs, count = self._resolve_count_and_page(qs, kwargs)
 
-        return CustomDjangoListObjectBase(
-            results=qs,
-            count=count,
-            results_field_name=self.type._meta.results_field_name,
-            page=kwargs.get('page', 1) if hasattr(self.pagination, 'page_query_param') else None,
-            pageSize=kwargs.get(
-                'pageSize',
-                graphql_api_settings.DEFAULT_PAGE_SIZE
-            ) if hasattr(self.pagination, 'page_size_query_param') else None
-        )
+        return self.get_list_object(qs, count, kwargs)
 
 
 def get_filtering_args_from_non_model_filterset(filterset_class):
@@ -422,7 +440,13 @@ def get_filtering_args_from_non_model_filterset(filterset_class):
     - args (dict): A dictionary of filtering arguments, where the key is the name of the argument and the value is the
     corresponding graphene argument type.
 
+    Note:
+    - The arguments are cached per filterset class, the returned dict is shared and shouldn't be modified.
+
     """
+    if filterset_class in get_filtering_args_from_non_model_filterset.cache:
+        return get_filtering_args_from_non_model_filterset.cache[filterset_class]
+
     from graphene_django.forms.converter import convert_form_field
 
     args = {}
@@ -431,9 +455,13 @@ def get_filtering_args_from_non_model_filterset(filterset_class):
         field_type = convert_form_field(form_field).Argument()
         field_type.description = filter_field.label
         args[name] = field_type
+    get_filtering_args_from_non_model_filterset.cache[filterset_class] = args
     return args
 
 
+get_filtering_args_from_non_model_filterset.cache = {}
+
+
 def generate_serializer_field_class(inner_type, serializer_field, non_null=False):
     """
 
@@ -584,10 +612,9 @@ def convert_serializer_to_type(serializer_class):
     :rtype: class
 
     """
-    cached_type = convert_serializer_to_type.cache.get(
-        serializer_class.__name__, None
-    )
-    if cached_type:
+    # NOTE: Cached by class, different serializers can share the same name
+    cached_type = convert_serializer_to_type.cache.get(serializer_class)
+    if cached_type is not None:
         return cached_type
     serializer = serializer_class()
 
@@ -607,7 +634,7 @@ def convert_serializer_to_type(serializer_class):
         base_classes,
         items,
     )
-    convert_serializer_to_type.cache[serializer_class.__name__] = ret_type
+    convert_serializer_to_type.cache[serializer_class] = ret_type
     return ret_type
 
 
@@ -694,7 +721,7 @@ def generate_type_for_serializer(
     )
     _type = type(name, (graphene.ObjectType,), data_members)
     if update_cache:
-        if name in convert_serializer_to_type.cache:
+        if serializer_class in convert_serializer_to_type.cache:
             raise Exception(f'<{name}> : <{serializer_class.__name__}> Alreay exists')
-        convert_serializer_to_type.cache[serializer_class.__name__] = _type
+        convert_serializer_to_type.cache[serializer_class] = _type
     return _type
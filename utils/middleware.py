@@ -10,7 +10,7 @@ from graphiql_debug_toolbar.serializers import CallableJSONEncoder
 
 __all__ = ['DebugToolbarMiddleware']
 
-_HTML_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+_HTML_TYPES = frozenset(("text/html", "application/xhtml+xml", "text/plain"))
 
 
 class DebugToolbarMiddleware(BaseMiddleware):
@@ -34,8 +34,14 @@ class DebugToolbarMiddleware(BaseMiddleware):
     """
     # https://github.com/flavors/django-graphiql-debug-toolbar/issues/9
     # https://gist.github.com/ulgens/e166ad31ec71e6b1f0777a8d81ce48ae
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        # NOTE: SHOW_TOOLBAR_CALLBACK is resolved once, middlewares are created when the server starts
+        self.show_toolbar = get_show_toolbar()
+
     def __call__(self, request):
-        if not get_show_toolbar()(request) or request.is_ajax():
+        # NOTE: Same as request.is_ajax() (deprecated since django 3.1)
+        if not self.show_toolbar(request) or request.META.get('HTTP_X_REQUESTED_WITH') == 'XMLHttpRequest':
             return self.get_response(request)
 
         content_type = request.content_type
@@ -66,8 +72,10 @@ class DebugToolbarMiddleware(BaseMiddleware):
 
         try:
             payload = get_payload(request, response, toolbar)
-        except:  # NOQA
-            return self.get_response(request)
+        except Exception:
+            # NOTE: The request is already processed, return its response without the toolbar payload.
+            # (Calling get_response again would execute the request, including mutations, twice)
+            return response
         response.content = json.dumps(payload, cls=CallableJSONEncoder)
         set_content_length(response)
         return response
@@ -1,4 +1,5 @@
 import hashlib
+from functools import wraps
 from typing import List, Callable
 import logging
 
@@ -10,6 +11,8 @@ PERMISSION_DENIED_MESSAGE = 'You do not have permission to perform this action.'
 
 logger = logging.getLogger(__name__)
 
+CACHE_MISS = object()
+
 
 def permission_checker(perms: List[str]) -> Callable[..., Callable]:
     """
@@ -43,9 +46,13 @@ def permission_checker(perms: List[str]) -> Callable[..., Callable]:
     `PERMISSION_DENIED_MESSAGE` constant is assumed to be defined elsewhere in the code.
 
     """
+    perms_key = ('has_perms', frozenset(perms))
+
     def wrapped(func):
+        @wraps(func)
         def wrapped_func(root, info, *args, **kwargs):
-            if not info.context.user.has_perms(perms):
+            # NOTE: Checked once per request for each set of permissions
+            if not info.context.cache_get_or_set(perms_key, lambda: info.context.user.has_perms(perms)):
                 raise PermissionDenied(gettext(PERMISSION_DENIED_MESSAGE))
             return func(root, info, *args, **kwargs)
         return wrapped_func
@@ -69,6 +76,7 @@ def is_authenticated() -> Callable[..., Callable]:
             pass
     """
     def wrapped(func):
+        @wraps(func)
         def wrapped_func(root, info, *args, **kwargs):
             if not info.context.user.is_authenticated:
                 raise PermissionDenied(gettext(PERMISSION_DENIED_MESSAGE))
@@ -93,10 +101,14 @@ def cache_key_function(*args, **kwargs):
 
         Example:
             cache_key_function('arg1', arg2='value2')
-            => 'c3bfc6483193a2789a1c920eeb719448924c62c2d5f491c25f184b2134c663ce'
+            => 'ad3b5e041d878c1686e99f5999e2aae3'
     """
-    logger.error('cache key')
-    return hashlib.sha256((str(args) + str(kwargs)).encode()).hexdigest()
+    # NOTE: Not used for security, blake2b (128 bit) is cheaper than sha256. kwargs are sorted for a stable key
+    # Fed piece by piece, instead of building one concatenated string
+    key_hash = hashlib.blake2b(digest_size=16)
+    key_hash.update(repr(args).encode())
+    key_hash.update(repr(tuple(sorted(kwargs.items()))).encode())
+    return key_hash.hexdigest()
 
 
 def cache_me(timeout=None):
@@ -111,10 +123,12 @@ def cache_me(timeout=None):
     - function: A wrapper function that caches the return value of the decorated function.
     """
     def wrapped(func):
+        @wraps(func)
         def wrapped_func(*args, **kwargs):
             cache_key = cache_key_function(func.__name__, *args, **kwargs)
-            cached_value = cache.get(cache_key)
-            if cached_value:
+            # NOTE: Falsy values (0, [], None) are valid cached values, a sentinel is used for the misses
+            cached_value = cache.get(cache_key, CACHE_MISS)
+            if cached_value is not CACHE_MISS:
                 return cached_value
             value = func(*args, **kwargs)
             cache.set(cache_key, value, timeout)
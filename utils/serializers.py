@@ -2,6 +2,37 @@ import json
 from django.core.serializers.json import DjangoJSONEncoder
 from rest_framework import serializers
 
+JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def is_plain_json(data):
+    """
+    Return True if data only has json types (no tuples, dates, decimals, non-str keys, ...), i.e. if
+    json.loads(json.dumps(data)) would return an equal value.
+    """
+    # NOTE: Iterative walk, nested inputs don't hit the recursion limit
+    stack = [data]
+    seen_ids = set()
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type in JSON_SCALAR_TYPES:
+            continue
+        if id(value) in seen_ids:
+            # Circular references are left to json.dumps (ValueError)
+            return False
+        seen_ids.add(id(value))
+        if value_type is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+        else:
+            return False
+    return True
+
 
 class IntegerIDField(serializers.IntegerField):
     """
@@ -56,7 +87,9 @@ class GraphqlSupportDrfSerializerJSONField(serializers.JSONField):
                     data = data.decode()
                 return json.loads(data, cls=self.decoder)
             else:
-                data = json.loads(json.dumps(data, cls=self.encoder))
+                # NOTE: GraphQL inputs are already plain json, the encoder round trip is only needed otherwise
+                if not is_plain_json(data):
+                    data = json.loads(json.dumps(data, cls=self.encoder))
         except (TypeError, ValueError):
             self.fail('invalid')
         return data
@@ -1,12 +1,15 @@
 import os
 import copy
 import shutil
+from collections import Counter
 from unittest.mock import patch
 import pytz
 import datetime
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core import management
+from django.db.models import QuerySet
 from django.test import TestCase, override_settings
 from django.conf import settings
 from graphene_django.utils import GraphQLTestCase
@@ -64,12 +67,20 @@ class CommonSetupClassMixin:
         self.assertIsNotNone(content.get('errors'), content)
 
     def assertQuerySetEqual(self, l1, l2, message=None):
+        # NOTE: Counter keeps the duplicates, same as comparing the sorted ids
         return self.assertEqual(
-            sorted([each.id for each in l1]),
-            sorted([each.id for each in l2]),
+            Counter(self._get_ids(l1)),
+            Counter(self._get_ids(l2)),
             message,
         )
 
+    @staticmethod
+    def _get_ids(items):
+        # Only fetch the id column for the querysets which are not evaluated yet
+        if isinstance(items, QuerySet) and items._result_cache is None:
+            return items.values_list('id', flat=True)
+        return (each.id for each in items)
+
 
 COMMON_OVERRIDE_SETTINGS = dict(
     SENTRY_DSN=None,
@@ -105,22 +116,11 @@ class HelixGraphQLTestCase(CommonSetupClassMixin, GraphQLTestCase):
 
 
 def create_user_with_role(role: str, monitoring_sub_region: int = None, country: int = None) -> User:
-    user = UserFactory.create()
-    user.raw_password = 'lhjsjsjsjlj'
-    user.set_password(user.raw_password)
-    user.save()  # saves it as a guest
-    user.refresh_from_db()
-    if role == USER_ROLE.ADMIN.name:
-        Portfolio.objects.create(
-            user=user,
-            role=USER_ROLE[role],
-        )
-    if role == USER_ROLE.REPORTING_TEAM.name:
-        Portfolio.objects.create(
-            user=user,
-            role=USER_ROLE[role],
-        )
-    if role == USER_ROLE.DIRECTORS_OFFICE.name:
+    raw_password = 'lhjsjsjsjlj'
+    # NOTE: Password is hashed before the create, a single save (and post_save) saves it as a guest
+    user = UserFactory.create(password=make_password(raw_password))
+    user.raw_password = raw_password
+    if role in (USER_ROLE.ADMIN.name, USER_ROLE.REPORTING_TEAM.name, USER_ROLE.DIRECTORS_OFFICE.name):
         Portfolio.objects.create(
             user=user,
             role=USER_ROLE[role],
@@ -1,8 +1,21 @@
+import json
+import logging
 from collections import OrderedDict
 from django.utils.translation import gettext
 from django.db.models.query import QuerySet
 from django.conf import settings
 import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+CAPTCHA_VERIFY_URL = 'https://hcaptcha.com/siteverify'
+# (connect, read) timeouts in seconds
+CAPTCHA_VERIFY_TIMEOUT = (3.05, 5)
+
+# NOTE: Shared session, the connection (and TLS handshake) to hcaptcha is reused across the verifications
+captcha_session = requests.Session()
+captcha_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
 
 
 class MissingCaptchaException(Exception):
@@ -48,8 +61,7 @@ def is_child_parent_dates_valid(
     errors = OrderedDict()
 
     if c_start_date and c_end_date and c_start_date > c_end_date:
-        errors['start_date'] = gettext('Choose your start date earlier than end date.')
-        errors['end_date'] = gettext('Choose your start date earlier than end date.')
+        errors['start_date'] = errors['end_date'] = gettext('Choose your start date earlier than end date.')
         return errors
     if c_start_date and p_start_date and p_start_date > c_start_date:
         errors['start_date'] = gettext('Choose your start date after %s start date: %s.') % (
@@ -59,6 +71,12 @@ def is_child_parent_dates_valid(
     return errors
 
 
+def _get_pks(values) -> set:
+    if isinstance(values, QuerySet):
+        return set(values.values_list('pk', flat=True))
+    return {getattr(value, 'pk', value) for value in values}
+
+
 def is_child_parent_inclusion_valid(data, instance, field, parent_field) -> OrderedDict:
     """
 
@@ -86,15 +104,27 @@ def is_child_parent_inclusion_valid(data, instance, field, parent_field) -> Orde
         value = [value]
     elif value is None:
         value = []
-    parent_value = data.get(parent_field.split('.')[0], getattr(instance, parent_field.split('.')[0], None))
-    for pf in parent_field.split('.')[1:]:
-        parent_value = parent_value.get(pf, None) if hasattr(parent_value, 'get') else getattr(parent_value, pf, None)
+    value_pks = _get_pks(value)
+    if not value_pks:
+        # Nothing to check, skip loading the parent values
+        return errors
+    parent_root, *parent_path = parent_field.split('.')
+    # NOTE: The instance attribute (can be a related object query) is only read when data doesn't have the parent
+    if parent_root in data:
+        parent_value = data[parent_root]
+    else:
+        parent_value = getattr(instance, parent_root, None)
+    for pf in parent_path:
+        if parent_value is None:
+            break
+        parent_value = parent_value.get(pf, None) if isinstance(parent_value, dict) else getattr(parent_value, pf, None)
     if parent_value:
         if hasattr(parent_value, 'all'):
             parent_value = parent_value.all()
     if parent_value is None:
         parent_value = []
-    if set(value).difference(parent_value):
+    # NOTE: Compare the pks, querysets are evaluated with values_list instead of loading the objects
+    if value_pks.difference(_get_pks(parent_value)):
         errors.update({
             field: gettext('%(field_name)s should be one of the following: %(parents)s.') % dict(
                 field_name=field.title(),
@@ -119,11 +149,15 @@ def validate_hcaptcha(captcha, site_key):
         :rtype: bool
 
     """
-    CAPTCHA_VERIFY_URL = 'https://hcaptcha.com/siteverify'
     SECRET_KEY = settings.HCAPTCHA_SECRET
 
     data = {'secret': SECRET_KEY, 'response': captcha, 'sitekey': site_key}
-    response = requests.post(url=CAPTCHA_VERIFY_URL, data=data)
-
-    response_json = response.json()
+    try:
+        response = captcha_session.post(url=CAPTCHA_VERIFY_URL, data=data, timeout=CAPTCHA_VERIFY_TIMEOUT)
+    except requests.RequestException:
+        logger.error('Failed to verify hcaptcha', exc_info=True)
+        return False
+
+    # NOTE: json.loads reads the bytes as is, response.json() first works out the text encoding
+    response_json = json.loads(response.content)
     return response_json['success']